@@ -4,6 +4,7 @@ import csv
 import tkinter as tk
 from tkinter import filedialog, messagebox, colorchooser
 from PIL import Image, ImageTk, ImageDraw, ImageFont
+from main import unique_output_path, render_or_reuse_certificate
 
 class CertificateDesigner:
     def __init__(self, root):
@@ -415,40 +416,24 @@ class CertificateDesigner:
             # Load font
             font = ImageFont.truetype(font_path, font_size)
             
-            # Get placeholder position
-            x, y = self.placeholder_position
-                
+            rendered = {}
+            used_paths = set()
+            reused = 0
+
             for name in participants:
-                # Open template
-                with Image.open(self.template_path) as im:
-                    draw = ImageDraw.Draw(im)
-                    
-                    # Calculate text dimensions for centering
-                    bbox = draw.textbbox((0, 0), name, font=font)
-                    text_width = bbox[2] - bbox[0]
-                    text_height = bbox[3] - bbox[1]
-                    
-                    # Center the text at the position
-                    x_centered = x - text_width // 2
-                    y_centered = y - text_height // 2
-                    
-                    # Draw text (centered) with selected color
-                    draw.text((x_centered, y_centered), name, font=font, fill=self.font_color)
-                    
-                    # Save output
-                    output_name = f"{name.replace(' ', '_')}.pdf"
-                    output_path = os.path.join(output_dir, output_name)
-                    
-                    # Convert to RGB and save as PDF
-                    rgb_im = im.convert('RGB')
-                    rgb_im.save(output_path, "PDF", resolution=100.0)
-                    
-                    processed += 1
-                    self.status_var.set(f"Generated {processed}/{total} certificates... {name}")
-                    self.root.update()
-                    
-            self.status_var.set(f"Successfully generated {processed} certificates in {output_dir}")
-            messagebox.showinfo("Success", f"Successfully generated {processed} certificates.")
+                output_path = unique_output_path(output_dir, name, 'pdf', used_paths)
+                if render_or_reuse_certificate(
+                    self.template_path, name, font_path, font_size, font,
+                    self.placeholder_position, self.font_color, output_path, True, rendered
+                ):
+                    reused += 1
+
+                processed += 1
+                self.status_var.set(f"Generated {processed}/{total} certificates... {name}")
+                self.root.update()
+
+            self.status_var.set(f"Successfully generated {processed} certificates in {output_dir} ({reused} reused renders)")
+            messagebox.showinfo("Success", f"Successfully generated {processed} certificates ({reused} reused renders).")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error generating certificates: {str(e)}")
@@ -3,6 +3,7 @@ import csv
 from PIL import Image, ImageDraw, ImageFont
 import sys
 import re
+import shutil
 
 def find_placeholder_position(template_path, placeholder="PLACEHOLDER_NAME"):
     """
@@ -40,6 +41,145 @@ def find_placeholder_position(template_path, placeholder="PLACEHOLDER_NAME"):
         print(f"Error analyzing template: {e}")
         return None
 
+def unique_output_path(output_dir, name, extension, used_paths):
+    """
+    Build an output path for a participant that has not been used earlier in the run.
+
+    Paths are compared case-insensitively so that names differing only in case
+    do not collide on case-insensitive filesystems.
+
+    Parameters:
+    - output_dir: Directory to save generated certificates.
+    - name: Participant name used to derive the file name.
+    - extension: File extension without the leading dot (e.g. "pdf").
+    - used_paths: Set of normalised paths already written in this run; updated in place.
+
+    Returns:
+    - A path such as "John_Doe.pdf", or "John_Doe_2.pdf" if that one is taken.
+    """
+    base_name = name.replace(' ', '_')
+    output_path = os.path.join(output_dir, f"{base_name}.{extension}")
+    counter = 2
+    while os.path.normcase(output_path).casefold() in used_paths:
+        output_path = os.path.join(output_dir, f"{base_name}_{counter}.{extension}")
+        counter += 1
+    used_paths.add(os.path.normcase(output_path).casefold())
+    return output_path
+
+def remove_existing_output(output_path):
+    """
+    Remove a file left at an output path before it is written again.
+
+    Writing in place would also change every file hardlinked to it, including
+    certificates from earlier runs, so the old directory entry is unlinked instead.
+
+    Parameters:
+    - output_path: Path that is about to be written.
+    """
+    if os.path.lexists(output_path):
+        os.remove(output_path)
+
+def reuse_rendered_certificate(source_path, output_path):
+    """
+    Place an already rendered certificate at another output path.
+
+    A hardlink is tried first; if the filesystem does not support it the file is copied.
+
+    Parameters:
+    - source_path: Path of the certificate rendered earlier in the run.
+    - output_path: Path where the same certificate should appear.
+    """
+    remove_existing_output(output_path)
+    try:
+        os.link(source_path, output_path)
+    except OSError:
+        shutil.copyfile(source_path, output_path)
+
+def render_certificate(template_path, name, font, position, fill, output_path, pdf_output=True):
+    """
+    Draw a participant name centred at a position on the template and save it.
+
+    Parameters:
+    - template_path: Path to the certificate template.
+    - name: Participant name to draw.
+    - font: Loaded ImageFont used for the name.
+    - position: (x, y) centre point of the name.
+    - fill: Text colour.
+    - output_path: Path to save the certificate to.
+    - pdf_output: If True, save as PDF, else in the format given by the extension.
+    """
+    remove_existing_output(output_path)
+
+    # Open template
+    with Image.open(template_path) as im:
+        draw = ImageDraw.Draw(im)
+
+        # Calculate text dimensions for centering
+        bbox = draw.textbbox((0, 0), name, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+
+        # Get the center point from position
+        x, y = position
+
+        # Center the text at the position
+        x_centered = x - text_width // 2
+        y_centered = y - text_height // 2
+
+        # Draw text (centered)
+        draw.text((x_centered, y_centered), name, font=font, fill=fill)
+
+        # Save output
+        if pdf_output:
+            # Convert to RGB and save as PDF
+            rgb_im = im.convert('RGB')
+            rgb_im.save(output_path, "PDF", resolution=100.0)
+        else:
+            im.save(output_path)
+
+def render_or_reuse_certificate(
+    template_path,
+    name,
+    font_path,
+    font_size,
+    font,
+    position,
+    fill,
+    output_path,
+    pdf_output,
+    rendered
+):
+    """
+    Produce one participant's certificate, reusing an identical render from this run if any.
+
+    Parameters:
+    - template_path: Path to the certificate template.
+    - name: Participant name to draw.
+    - font_path: Path to the .ttf font file the font was loaded from.
+    - font_size: Font size the font was loaded with.
+    - font: Loaded ImageFont used for the name.
+    - position: (x, y) centre point of the name.
+    - fill: Text colour.
+    - output_path: Unique path to save the certificate to.
+    - pdf_output: If True, save as PDF, else PNG.
+    - rendered: Dict mapping render keys to paths rendered in this run; updated in place.
+
+    Returns:
+    - True if an earlier render was reused, False if the certificate was rendered.
+    """
+    # Identical text and layout produce identical bytes, so render each once
+    render_key = (
+        name, template_path, font_path, font_size,
+        tuple(position), tuple(fill), 'pdf' if pdf_output else 'png'
+    )
+    if render_key in rendered:
+        reuse_rendered_certificate(rendered[render_key], output_path)
+        return True
+
+    render_certificate(template_path, name, font, position, fill, output_path, pdf_output)
+    rendered[render_key] = output_path
+    return False
+
 def generate_certificates(
     template_path: str,
     participants_csv: str,
@@ -65,6 +205,9 @@ def generate_certificates(
     - pdf_output: If True, save certificates as PDF, else PNG.
     - has_header: If True, CSV file has a header row.
     - placeholder_name: The text to look for in the template to determine name position.
+
+    Certificates with identical text and layout are rendered only once per run;
+    later rows reuse the encoded file via a hardlink (or copy) at their own path.
     """
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
@@ -91,38 +234,26 @@ def generate_certificates(
             reader = csv.reader(csvfile)
             participants = [row[0] for row in reader]
 
-        for name in participants:
-            # Open template
-            with Image.open(template_path) as im:
-                draw = ImageDraw.Draw(im)
-                
-                # Calculate text dimensions for centering
-                bbox = draw.textbbox((0, 0), name, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                
-                # Get the center point from position
-                x, y = position
-                
-                # Center the text at the position
-                x_centered = x - text_width // 2
-                y_centered = y - text_height // 2
+    extension = 'pdf' if pdf_output else 'png'
+    fill = (0, 0, 0)  # black text
+    rendered = {}
+    used_paths = set()
+    generated = 0
+    reused = 0
 
-                # Draw text (centered)
-                draw.text((x_centered, y_centered), name, font=font, fill=(0, 0, 0))  # black text
-
-                # Save output
-                output_name = f"{name.replace(' ', '_')}.{'pdf' if pdf_output else 'png'}"
-                output_path = os.path.join(output_dir, output_name)
-
-                if pdf_output:
-                    # Convert to RGB and save as PDF
-                    rgb_im = im.convert('RGB')
-                    rgb_im.save(output_path, "PDF", resolution=100.0)
-                else:
-                    im.save(output_path)
+    for name in participants:
+        output_path = unique_output_path(output_dir, name, extension, used_paths)
+        if render_or_reuse_certificate(
+            template_path, name, font_path, font_size, font,
+            position, fill, output_path, pdf_output, rendered
+        ):
+            reused += 1
+            print(f"Reused certificate for {name} -> {output_path}")
+        else:
+            print(f"Generated certificate for {name} -> {output_path}")
+        generated += 1
 
-                print(f"Generated certificate for {name} -> {output_path}")
+    print(f"Generated {generated} certificates in {output_dir} ({reused} reused renders)")
 
 def prepare_template_with_placeholder(template_path, output_path, font_path, font_size=48, placeholder="PLACEHOLDER_NAME"):
     """
@@ -0,0 +1,102 @@
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from main import (  # noqa: E402
+    generate_certificates,
+    render_certificate,
+    reuse_rendered_certificate,
+    unique_output_path,
+)
+from PIL import Image, ImageFont  # noqa: E402
+
+FONT_PATH = os.path.join(REPO_DIR, 'arial.ttf')
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    path = tmp_path / 'template.png'
+    Image.new('RGB', (200, 100), (255, 255, 255)).save(path)
+    return str(path)
+
+
+def write_participants(path, names):
+    path.write_text(''.join(f"{name}\n" for name in names), encoding='utf-8')
+    return str(path)
+
+
+def test_unique_output_path_numbers_repeated_names(tmp_path):
+    used_paths = set()
+    paths = [unique_output_path(str(tmp_path), 'John Doe', 'pdf', used_paths) for _ in range(3)]
+    assert [os.path.basename(p) for p in paths] == ['John_Doe.pdf', 'John_Doe_2.pdf', 'John_Doe_3.pdf']
+
+
+def test_unique_output_path_skips_literal_suffixed_name(tmp_path):
+    used_paths = set()
+    names = ['Alice', 'Alice_2', 'Alice']
+    paths = [unique_output_path(str(tmp_path), name, 'png', used_paths) for name in names]
+    assert [os.path.basename(p) for p in paths] == ['Alice.png', 'Alice_2.png', 'Alice_3.png']
+
+
+def test_unique_output_path_ignores_case(tmp_path):
+    used_paths = set()
+    names = ['John Doe', 'john doe']
+    paths = [unique_output_path(str(tmp_path), name, 'pdf', used_paths) for name in names]
+    assert [os.path.basename(p) for p in paths] == ['John_Doe.pdf', 'john_doe_2.pdf']
+
+
+def test_reuse_rendered_certificate_replaces_existing_file(tmp_path):
+    source = tmp_path / 'source.png'
+    target = tmp_path / 'target.png'
+    source.write_bytes(b'new')
+    target.write_bytes(b'old')
+    reuse_rendered_certificate(str(source), str(target))
+    assert target.read_bytes() == b'new'
+
+
+def test_generate_certificates_reports_reused_renders(tmp_path, template_path, capsys):
+    participants = write_participants(tmp_path / 'p.csv', ['Alice', 'Bob', 'Alice', 'Alice'])
+    output_dir = tmp_path / 'out'
+    generate_certificates(template_path, participants, str(output_dir), FONT_PATH, 20,
+                          position=(100, 50), pdf_output=False)
+
+    assert sorted(os.listdir(output_dir)) == ['Alice.png', 'Alice_2.png', 'Alice_3.png', 'Bob.png']
+    assert (output_dir / 'Alice.png').read_bytes() == (output_dir / 'Alice_3.png').read_bytes()
+    summary = capsys.readouterr().out.splitlines()[-1]
+    assert summary == f"Generated 4 certificates in {output_dir} (2 reused renders)"
+
+
+def test_render_does_not_modify_stale_hardlink_sibling(tmp_path, template_path):
+    output_dir = tmp_path / 'out'
+
+    # Run 1 links Alice.png and Alice_2.png to the same render
+    first = write_participants(tmp_path / 'first.csv', ['Alice', 'Alice'])
+    generate_certificates(template_path, first, str(output_dir), FONT_PATH, 20,
+                          position=(100, 50), pdf_output=False)
+    alice_before = (output_dir / 'Alice.png').read_bytes()
+
+    # Run 2 renders a participant literally named Alice_2 over the linked path
+    second = write_participants(tmp_path / 'second.csv', ['Alice_2'])
+    generate_certificates(template_path, second, str(output_dir), FONT_PATH, 20,
+                          position=(100, 50), pdf_output=False)
+
+    assert (output_dir / 'Alice.png').read_bytes() == alice_before
+    assert (output_dir / 'Alice_2.png').read_bytes() != alice_before
+
+
+def test_render_certificate_unlinks_before_writing(tmp_path, template_path):
+    sibling = tmp_path / 'sibling.png'
+    output_path = tmp_path / 'out.png'
+    sibling.write_bytes(b'keep')
+    os.link(sibling, output_path)
+
+    font = ImageFont.truetype(FONT_PATH, 20)
+    render_certificate(template_path, 'Bob', font, (100, 50), (0, 0, 0), str(output_path),
+                       pdf_output=False)
+
+    assert sibling.read_bytes() == b'keep'
+    assert output_path.read_bytes() != b'keep'